@@ -1,11 +1,25 @@
 #!/usr/bin/env python3
 
 import argparse
+import asyncio
 import httpx
 import os
+import random
 import re
+import socket
 from urllib.parse import urljoin, urlparse
 
+# HTTP/2 multiplexing needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# Patterns for BurpJSLinkFinder output lines
+BASE_URL_RE = re.compile(r"\[\+\] Valid URL found: (https?://[^\s]+)")
+ENDPOINT_RE = re.compile(r"\d+\s+-\s+(.+)")
+
 def parse_input_file(input_file):
     """
     Parses BurpJSLinkFinder output to extract base URLs and endpoints.
@@ -19,26 +33,30 @@ def parse_input_file(input_file):
             line = line.strip()
 
             # Detect base URL from "[+] Valid URL found: ..."
-            base_url_match = re.match(r"\[\+\] Valid URL found: (https?://[^\s]+)", line)
-            if base_url_match:
-                current_base_url = base_url_match.group(1)
-                results[current_base_url] = []
-                continue
+            if line[:1] == "[":
+                base_url_match = BASE_URL_RE.match(line)
+                if base_url_match:
+                    current_base_url = base_url_match.group(1)
+                    results[current_base_url] = []
 
             # Extract endpoints (lines starting with a number followed by "-")
-            endpoint_match = re.match(r"\d+\s+-\s+(.+)", line)
-            if endpoint_match and current_base_url:
-                results[current_base_url].append(endpoint_match.group(1))
+            elif line[:1].isdigit() and current_base_url:
+                endpoint_match = ENDPOINT_RE.match(line)
+                if endpoint_match:
+                    results[current_base_url].append(endpoint_match.group(1))
 
     return results
 
-def construct_url(base_url, endpoint):
-    """Constructs a full URL based on BurpJSLinkFinder output rules."""
-    endpoint = endpoint.strip()
-
-    # Parse base URL to extract JS directory
+def split_base_url(base_url):
+    """Returns the (scheme://netloc, JS directory) pair that endpoints are resolved against."""
     parsed_url = urlparse(base_url)
+    root = parsed_url.scheme + "://" + parsed_url.netloc
     js_dir = os.path.dirname(parsed_url.path) + "/"
+    return root, js_dir
+
+def construct_url(root, js_dir, endpoint):
+    """Constructs a full URL based on BurpJSLinkFinder output rules."""
+    endpoint = endpoint.strip()
 
     # Full URLs (https://example.com/path)
     if endpoint.startswith("http://") or endpoint.startswith("https://"):
@@ -46,29 +64,120 @@ def construct_url(base_url, endpoint):
 
     # Absolute URLs or dotted URLs (/path or ../path)
     elif endpoint.startswith("/") or endpoint.startswith("../"):
-        return urljoin(parsed_url.scheme + "://" + parsed_url.netloc, endpoint)
+        return urljoin(root, endpoint)
 
-    # Relative URLs with at least one slash (text/test.php)
-    elif "/" in endpoint:
-        return urljoin(parsed_url.scheme + "://" + parsed_url.netloc + js_dir, endpoint)
-
-    # Relative URLs without a slash (test.php)
+    # Relative URLs, with or without a slash (text/test.php, test.php)
     else:
-        return urljoin(parsed_url.scheme + "://" + parsed_url.netloc + js_dir, endpoint)
-
-def test_url(url):
-    """Tests a URL using HTTPX and returns an HTTP status or detailed error."""
+        return urljoin(root + js_dir, endpoint)
+
+# Concurrency limits for the async scanner
+MAX_CONCURRENCY = 64
+MAX_PER_HOST = 8
+MAX_RETRIES = 5
+MAX_BACKOFF = 30
+
+def backoff_delay(attempt, response=None):
+    """Returns seconds to wait before a retry, honoring Retry-After when the server sends one."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(int(retry_after), MAX_BACKOFF)
+    return min(2 ** attempt, MAX_BACKOFF) + random.random()
+
+def is_name_resolution_error(exc):
+    """Returns True if the connection failed because the hostname does not resolve."""
+    while exc is not None:
+        if isinstance(exc, socket.gaierror):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+async def test_url(client, sem, host_sems, url):
+    """
+    Tests a URL using HTTPX and returns an HTTP status or detailed error.
+    The concurrency slots are only held while a request is in flight, never during a backoff sleep.
+    """
     try:
-        response = httpx.get(url, follow_redirects=True, timeout=5, verify=False)
+        host = urlparse(url).netloc
+    except ValueError as e:
+        return f"Invalid URL ({e})"
+    if host not in host_sems:
+        host_sems[host] = asyncio.Semaphore(MAX_PER_HOST)
+
+    for attempt in range(MAX_RETRIES):
+        last_attempt = attempt == MAX_RETRIES - 1
+        try:
+            # Wait for the host slot first so requests queued on a busy host hold no global slot
+            async with host_sems[host], sem:
+                response = await client.get(url, follow_redirects=True, timeout=5)
+        except httpx.TimeoutException:
+            if last_attempt:
+                return "Timeout"
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+        except httpx.ConnectError as e:
+            # Unresolvable hosts will not start resolving on a retry
+            if last_attempt or is_name_resolution_error(e):
+                return f"Connection Error ({e})"
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+        except httpx.HTTPStatusError as e:
+            return f"HTTP Error {e.response.status_code}"
+        except httpx.RequestError as e:
+            return f"Request Failed ({e})"
+        except (httpx.InvalidURL, ValueError) as e:
+            return f"Invalid URL ({e})"
+
+        # Back off when the server is rate limiting or temporarily unavailable
+        if response.status_code in (429, 503) and not last_attempt:
+            await asyncio.sleep(backoff_delay(attempt, response))
+            continue
         return response.status_code  # Successfully retrieved a status code
-    except httpx.HTTPStatusError as e:
-        return f"HTTP Error {e.response.status_code}"
-    except httpx.TimeoutException:
-        return "Timeout"
-    except httpx.ConnectError as e:
-        return f"Connection Error ({e})"
-    except httpx.RequestError as e:
-        return f"Request Failed ({e})"
+
+async def check_url(client, sem, host_sems, url):
+    """Tests a URL and returns it together with its status."""
+    return url, await test_url(client, sem, host_sems, url)
+
+async def run(parsed_data):
+    """
+    Constructs every unique URL and tests them concurrently.
+    Prints each result as soon as it completes and returns all result lines in input order.
+    """
+    urls = []
+    seen = set()  # The same URL is often built from several bases; request it only once
+    for base_url, endpoints in parsed_data.items():
+        # Parse each base URL once and reuse it for all of its endpoints
+        try:
+            root, js_dir = split_base_url(base_url)
+        except ValueError as e:
+            print(f"[!] Skipping invalid base URL {base_url} ({e})")
+            continue
+        for endpoint in endpoints:
+            try:
+                full_url = construct_url(root, js_dir, endpoint)
+            except ValueError as e:
+                print(f"[!] Skipping invalid endpoint {endpoint} ({e})")
+                continue
+            if full_url and full_url not in seen:
+                seen.add(full_url)
+                urls.append(full_url)
+
+    print(f"\n[+] Testing {len(urls)} URLs from {len(parsed_data)} base(s)")
+
+    print("[+] Using HTTP/2 where supported" if HTTP2 else "[+] Using HTTP/1.1 (install h2 for HTTP/2)")
+
+    limits = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    host_sems = {}
+    statuses = {}
+    async with httpx.AsyncClient(http2=HTTP2, verify=False, limits=limits) as client:
+        tasks = [check_url(client, sem, host_sems, url) for url in urls]
+        for done, task in enumerate(asyncio.as_completed(tasks), 1):
+            url, status = await task
+            statuses[url] = status
+            print(f"[{status}] {url} ({done}/{len(urls)})")
+
+    return [f"[{statuses[url]}] {url}" for url in urls]
 
 def main():
     parser = argparse.ArgumentParser(
@@ -81,17 +190,7 @@ def main():
 
     parsed_data = parse_input_file(args.input)
 
-    results = []
-    for base_url, endpoints in parsed_data.items():
-        print(f"\n[+] Processing URLs for base: {base_url}")
-
-        for endpoint in endpoints:
-            full_url = construct_url(base_url, endpoint)
-            if full_url:
-                status = test_url(full_url)
-                result = f"[{status}] {full_url}"
-                print(result)
-                results.append(result)
+    results = asyncio.run(run(parsed_data))
 
     # Save results to output file if specified
     if args.output:
@@ -2,12 +2,31 @@
 # Author: Shea Norwood
 # Description: This script parses a Burp Suite JSON export to extract 'host' fields,
 # cleans them by removing regex-specific characters and wildcards, prepends 'https://',
-# removes duplicates, and saves the unique URLs to 'https.txt'.
+# removes duplicates, and saves the unique URLs to 'https.txt' (or the file given with -o).
 
+import argparse
 import json
 import re
 import os
 
+# Stream the export with ijson when available; otherwise load it in memory,
+# preferring orjson over the standard library parser.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson as json_parser
+except ImportError:
+    json_parser = json
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+# Regex anchors, escapes and wildcards to strip from Burp host patterns
+HOST_PATTERN_CHARS = re.compile(r'[\\^$*+]')
+
 def extract_domain(host_pattern):
     """
     Extracts the base domain from the host pattern by removing regex characters and wildcards.
@@ -18,19 +37,9 @@ def extract_domain(host_pattern):
     Returns:
         str: The cleaned base domain.
     """
-    # Remove regex-specific characters: ^, $, and escape characters \
-    host = re.sub(r'[\\\^\$]', '', host_pattern)
-    
-    # Remove leading wildcard patterns like *., +., .*, .+., etc.
-    host = re.sub(r'^(\.\*|\.\+|\*\.|\+\.)', '', host)
-    
-    # Remove any remaining wildcards within the domain (e.g., * or +)
-    host = re.sub(r'[\*\+]', '', host)
-    
-    # Remove leading and trailing dots if any
-    host = host.strip('.')
-    
-    return host
+    # Remove regex-specific characters (^, $, \) and wildcards (*, +) in one pass.
+    # Any dot left behind by a leading wildcard (e.g. *. or .*) is removed by strip.
+    return HOST_PATTERN_CHARS.sub('', host_pattern).strip('.')
 
 def get_input_filename():
     """
@@ -47,72 +56,124 @@ def get_input_filename():
         else:
             print(f"Error: The file '{filename}' does not exist. Please try again.\n")
 
-def find_hosts(data, hosts=None, path=''):
+def stream_hosts(file, verbose=False):
     """
-    Recursively searches for all 'host' or 'hostname' fields in the JSON data.
+    Streams the JSON document and yields every 'host' or 'hostname' string value.
+    The document is never fully loaded into memory.
     
     Args:
-        data (dict or list): The JSON data.
-        hosts (list, optional): The list to accumulate host patterns.
-        path (str, optional): The current JSON path (for debugging).
+        file (file object): The open JSON file (binary mode).
+        verbose (bool, optional): Report each host found on stdout.
     
-    Returns:
-        list: A list of all found host patterns.
+    Yields:
+        str: Each host pattern as it is encountered.
+    """
+    for prefix, event, value in ijson.parse(file):
+        # Check for 'host' or 'hostname' (case-insensitive)
+        if event == 'string' and prefix.rsplit('.', 1)[-1].lower() in ('host', 'hostname'):
+            if verbose:
+                print(f"Found host at path: {prefix} -> {value}")
+            yield value
+
+def walk_hosts(file, verbose=False):
     """
-    if hosts is None:
-        hosts = []
-
-    if isinstance(data, dict):
-        for key, value in data.items():
-            current_path = f"{path}.{key}" if path else key
-            # Check for 'host' or 'hostname' (case-insensitive)
-            if key.lower() in ['host', 'hostname']:
-                print(f"Found '{key}' at path: {current_path} -> {value}")
-                hosts.append(value)
-            else:
-                find_hosts(value, hosts, current_path)
-    elif isinstance(data, list):
-        for index, item in enumerate(data):
-            current_path = f"{path}[{index}]"
-            find_hosts(item, hosts, current_path)
-
-    return hosts
+    Loads the whole JSON document and yields every 'host' or 'hostname' string value.
+    Uses an explicit stack rather than recursion, and matches stream_hosts: non-string
+    host values are searched like any other node, and paths use ijson's prefix format.
+    
+    Args:
+        file (file object): The open JSON file (binary mode).
+        verbose (bool, optional): Report each host found on stdout.
+    
+    Yields:
+        str: Each host pattern as it is encountered.
+    """
+    stack = [('', json_parser.loads(file.read()))]
+    while stack:
+        prefix, data = stack.pop()
+        if isinstance(data, dict):
+            items = data.items()
+        elif isinstance(data, list):
+            items = (('item', item) for item in data)
+        else:
+            continue
+
+        children = []
+        for key, value in items:
+            # Only build the path when it is going to be printed
+            path = (f"{prefix}.{key}" if prefix else key) if verbose else None
+            if isinstance(value, str):
+                # Check for 'host' or 'hostname' (case-insensitive)
+                if key.lower() in ('host', 'hostname'):
+                    if verbose:
+                        print(f"Found host at path: {path} -> {value}")
+                    yield value
+            elif isinstance(value, (dict, list)):
+                children.append((path, value))
+        stack.extend(reversed(children))
+
+def find_hosts(file, verbose=False):
+    """
+    Yields every 'host' or 'hostname' value in the JSON file, streaming when ijson is installed.
+    
+    Args:
+        file (file object): The open JSON file (binary mode).
+        verbose (bool, optional): Report each host found on stdout.
+    
+    Yields:
+        str: Each host pattern as it is encountered.
+    """
+    if ijson:
+        return stream_hosts(file, verbose)
+    return walk_hosts(file, verbose)
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Extract 'host' fields from a Burp Suite JSON export and save them as unique HTTPS URLs."
+    )
+    parser.add_argument("-i", "--input", help="Burp JSON file to parse (prompted for when omitted)")
+    parser.add_argument("-o", "--output", default="https.txt", help="Output file for the unique URLs (default: https.txt)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print each host and URL as it is processed")
+
+    args = parser.parse_args()
+
     # Configuration
-    output_txt_file = 'https.txt'
+    output_txt_file = args.output
     protocol = 'https://'  # Only prepend HTTPS
 
-    # Prompt user for input file
-    input_json_file = get_input_filename()
+    # Prompt user for input file unless one was given on the command line
+    if args.input:
+        if not os.path.isfile(args.input):
+            parser.error(f"The file '{args.input}' does not exist.")
+        input_json_file = args.input
+    else:
+        input_json_file = get_input_filename()
 
     try:
-        # Read the JSON data
-        with open(input_json_file, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-
-        # Find all 'host' or 'hostname' entries recursively
-        host_patterns = find_hosts(data)
+        urls = set()  # Use a set to automatically handle duplicates
+        hosts_found = 0
+
+        # Stream all 'host' or 'hostname' entries from the JSON data
+        with open(input_json_file, 'rb') as file:
+            for host_pattern in find_hosts(file, args.verbose):
+                hosts_found += 1
+                if host_pattern:
+                    domain = extract_domain(host_pattern)
+                    if domain:
+                        full_url = protocol + domain
+                        urls.add(full_url)
+                        if args.verbose:
+                            print(f"Processed URL: {full_url}")
+                    else:
+                        print(f"Warning: Unable to extract domain from pattern '{host_pattern}'. Skipping.")
+                else:
+                    print("Warning: Found an empty 'host' or 'hostname' field. Skipping.")
 
-        if not host_patterns:
+        if not hosts_found:
             print("\nNo 'host' or 'hostname' fields found in the JSON data.")
             print("Please verify the JSON structure or check for alternative key names.")
             return
 
-        urls = set()  # Use a set to automatically handle duplicates
-
-        for host_pattern in host_patterns:
-            if host_pattern:
-                domain = extract_domain(host_pattern)
-                if domain:
-                    full_url = protocol + domain
-                    urls.add(full_url)
-                    print(f"Processed URL: {full_url}")
-                else:
-                    print(f"Warning: Unable to extract domain from pattern '{host_pattern}'. Skipping.")
-            else:
-                print("Warning: Found an empty 'host' or 'hostname' field. Skipping.")
-
         if urls:
             # Write the unique URLs to the output file
             with open(output_txt_file, 'w', encoding='utf-8') as outfile:
@@ -123,7 +184,7 @@ def main():
         else:
             print("No valid 'host' or 'hostname' entries found to process.")
 
-    except json.JSONDecodeError:
+    except JSON_ERRORS:
         print(f"Error: The file '{input_json_file}' is not valid JSON.")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
@@ -1,9 +1,25 @@
+import argparse
+import os
 import re
+import sys
+from contextlib import nullcontext
+from urllib.parse import urlsplit
 
 def extract_domain(url):
-    """Extract the domain from a given URL."""
-    match = re.search(r'^(?:https?://)?(?:www\.)?([^/:]+)', url)
-    return match.group(1) if match else None
+    """Extract the domain (lowercased, without port or leading 'www.') from a given URL."""
+    # Only treat the text before '://' as a scheme if it could be one; scheme-less URLs
+    # often carry another URL in a redirect parameter (example.com/r?u=https://...)
+    scheme, sep, _ = url.partition('://')
+    if not sep or not scheme or any(c in scheme for c in '/?.'):
+        url = 'http://' + url
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        # Malformed netloc, e.g. an unterminated IPv6 literal
+        return None
+    if not host:
+        return None
+    return host[4:] if host.startswith('www.') else host
 
 def read_domains_from_file(filename):
     """
@@ -16,6 +32,8 @@ def read_domains_from_file(filename):
             line = line.strip()
             if not line:
                 continue
+            # Hostnames are case-insensitive; extract_domain lowercases too
+            line = line.lower()
             # Remove 'http://' or 'https://' if present
             line = re.sub(r'^https?://', '', line)
             # Remove trailing slash if any
@@ -26,103 +44,139 @@ def read_domains_from_file(filename):
             domains.append(line)
     return domains
 
-def domain_in_scope(domain, scope_domain, allow_wildcards):
+def in_suffix_set(domain, domain_set):
     """
-    Check if 'domain' is in scope based on 'scope_domain' and wildcard preference.
-    
-    If allow_wildcards=True, then any subdomain of 'scope_domain' matches.
-    For example, 'scope_domain' = 'example.com', domain_in_scope('sub.example.com', scope_domain, True) => True.
-    Otherwise, exact or www. match only.
+    Check if 'domain' or any of its parent domains is in 'domain_set'.
+    For example, 'a.b.example.com' is checked as 'a.b.example.com', 'b.example.com', 'example.com' and 'com'.
+    Suffixes are sliced at each dot, so a lookup costs O(len(domain)) however large the set is.
     """
-    if allow_wildcards:
-        # e.g. scope_domain = 'example.com'
-        # any domain that ends with 'example.com' (and is not exactly 'example.com' if you want subdomains)
-      
-        return domain == scope_domain or domain.endswith(f".{scope_domain}")
-    else:
-        # Exact match or 'www.' variants
-        return (domain == scope_domain or
-                domain == f"www.{scope_domain}" or
-                f"www.{domain}" == scope_domain)
-
-def is_in_scope(domain, scope_domains, allow_wildcards):
-    """
-    Loop over all scope_domains and see if 'domain' is in any of them based on wildcard preference.
-    """
-    for scope_d in scope_domains:
-        if domain_in_scope(domain, scope_d, allow_wildcards):
+    start = 0
+    while True:
+        if domain[start:] in domain_set:
             return True
-    return False
+        start = domain.find('.', start) + 1
+        if not start:
+            return False
 
-def process_urls(scope_file, url_file):
-    """Process URLs, classify them as in-scope or out-of-scope, and handle results."""
-
-    #  Ask if the user wants wildcard subdomains
-    allow_wildcards_str = input("Do you want to allow wildcard subdomains? (yes/no): ").strip().lower()
-    allow_wildcards = (allow_wildcards_str == "yes")
-
-    #  Ask if there is an out-of-scope file
-    has_oos_file = input("Are there any out-of-scope URLs? (yes/no): ").strip().lower()
+def is_in_scope(domain, scope_set, allow_wildcards):
+    """
+    Check if 'domain' is in the set of scope domains based on wildcard preference.
+    Each lookup is a set membership test, so the cost does not grow with the size of the scope.
+    """
+    if allow_wildcards:
+        return in_suffix_set(domain, scope_set)
+    # Exact match or 'www.' variants
+    return (domain in scope_set or
+            (domain.startswith("www.") and domain[4:] in scope_set) or
+            f"www.{domain}" in scope_set)
 
-    out_of_scope_list = []
-    if has_oos_file == "yes":
-        oos_filename = input("Enter the out-of-scope file name: ").strip()
-        out_of_scope_list = read_domains_from_file(oos_filename)
+def url_in_scope(url, scope_set, oos_set, allow_wildcards):
+    """Classify a single URL, returning True if it is in scope and not excluded as out-of-scope."""
+    domain = extract_domain(url)
 
-    #  Read scope domains from the scope file
-    scope_domains = read_domains_from_file(scope_file)
+    if not domain:
+        # If domain cannot be parsed, default to out of scope
+        return False
 
-    #  Read URLs from the URL file
-    with open(url_file, 'r') as uf:
-        urls = [line.strip() for line in uf if line.strip()]
+    # Check if domain is in out-of-scope list
+    if in_suffix_set(domain, oos_set):
+        return False
 
-    in_scope_urls = []
-    out_of_scope_urls = []
+    # Now check if domain is in scope
+    return is_in_scope(domain, scope_set, allow_wildcards)
 
-    # Classify URLs
-    for url in urls:
-        domain = extract_domain(url)
+def process_urls(scope_file, url_file, allow_wildcards=False, oos_file=None, cleaned_file=None, removed_file=None):
+    """
+    Process URLs, classify them as in-scope or out-of-scope, and stream results to the output files.
+    In-scope URLs go to stdout when no cleaned_file is given; out-of-scope URLs are discarded
+    when no removed_file is given.
+    """
 
-        if not domain:
-            # If domain cannot be parsed, default to out of scope
-            out_of_scope_urls.append(url)
-            continue
+    out_of_scope_list = []
+    if oos_file:
+        out_of_scope_list = read_domains_from_file(oos_file)
+    oos_set = frozenset(out_of_scope_list)
 
-        # Check if domain is in out-of-scope list
-  
-        if any(d == domain or domain.endswith(f".{d}") for d in out_of_scope_list):
-            out_of_scope_urls.append(url)
-            continue
+    #  Read scope domains from the scope file
+    scope_set = frozenset(read_domains_from_file(scope_file))
+
+    in_scope_count = 0
+    out_of_scope_count = 0
+
+    # Classify URLs one line at a time
+    with open(url_file, 'r') as uf, \
+            (open(cleaned_file, 'w') if cleaned_file else nullcontext(sys.stdout)) as cf, \
+            open(removed_file or os.devnull, 'w') as rf:
+        for line in uf:
+            url = line.strip()
+            if not url:
+                continue
 
-        # Now check if domain is in scope
-        if is_in_scope(domain, scope_domains, allow_wildcards):
-            in_scope_urls.append(url)
-        else:
-            out_of_scope_urls.append(url)
+            if url_in_scope(url, scope_set, oos_set, allow_wildcards):
+                cf.write(url + "\n")
+                in_scope_count += 1
+            else:
+                rf.write(url + "\n")
+                out_of_scope_count += 1
+
+    # Output results; keep stdout clean for the URLs when they are written there
+    summary = sys.stdout if cleaned_file else sys.stderr
+    print(f"\nIn-scope URLs: {in_scope_count}", file=summary)
+    print(f"Out-of-scope URLs: {out_of_scope_count}", file=summary)
+
+    if cleaned_file:
+        print(f"In-scope URLs saved to {cleaned_file}", file=summary)
+    if removed_file:
+        print(f"Out-of-scope URLs saved to {removed_file}", file=summary)
+
+def prompt_options():
+    """Interactively ask for every option, returning them as process_urls keyword arguments."""
+    scope_file = input("Enter the scope file name: ").strip()
+    url_file = input("Enter the URL file name: ").strip()
 
-    # Output results
-    print("\nIn-scope URLs:")
-    print("\n".join(in_scope_urls))
+    #  Ask if the user wants wildcard subdomains
+    allow_wildcards_str = input("Do you want to allow wildcard subdomains? (yes/no): ").strip().lower()
+    allow_wildcards = (allow_wildcards_str == "yes")
 
-    print("\nOut-of-scope URLs:")
-    print("\n".join(out_of_scope_urls))
+    #  Ask if there is an out-of-scope file
+    oos_file = None
+    has_oos_file = input("Are there any out-of-scope URLs? (yes/no): ").strip().lower()
+    if has_oos_file == "yes":
+        oos_file = input("Enter the out-of-scope file name: ").strip()
 
-    # Optional saving of results
+    # Ask where to save results up front so URLs can be written as they are classified
+    cleaned_file = None
     save_cleaned = input("\nDo you want to save in-scope URLs? (yes/no): ").strip().lower()
     if save_cleaned == "yes":
         cleaned_file = input("Enter the filename to save in-scope URLs: ").strip()
-        with open(cleaned_file, 'w') as cf:
-            cf.write("\n".join(in_scope_urls))
-        print(f"In-scope URLs saved to {cleaned_file}")
 
+    removed_file = None
     save_removed = input("\nDo you want to save out-of-scope URLs? (yes/no): ").strip().lower()
     if save_removed == "yes":
         removed_file = input("Enter the filename to save out-of-scope URLs: ").strip()
-        with open(removed_file, 'w') as rf:
-            rf.write("\n".join(out_of_scope_urls))
-        print(f"Out-of-scope URLs saved to {removed_file}")
+
+    return dict(scope_file=scope_file, url_file=url_file, allow_wildcards=allow_wildcards,
+                oos_file=oos_file, cleaned_file=cleaned_file, removed_file=removed_file)
+
+def main():
+    # Keep the interactive prompts when run without arguments
+    if len(sys.argv) == 1:
+        process_urls(**prompt_options())
+        return
+
+    parser = argparse.ArgumentParser(
+        description="Classify URLs as in-scope or out-of-scope against a list of scope domains."
+    )
+    parser.add_argument("-s", "--scope", required=True, help="File containing in-scope domains")
+    parser.add_argument("-u", "--urls", required=True, help="File containing URLs to classify")
+    parser.add_argument("-w", "--wildcards", action="store_true", help="Treat subdomains of scope domains as in scope")
+    parser.add_argument("--oos", help="File containing out-of-scope domains")
+    parser.add_argument("--save-in", help="Output file for in-scope URLs (default: stdout)")
+    parser.add_argument("--save-out", help="Output file for out-of-scope URLs")
+
+    args = parser.parse_args()
+
+    process_urls(args.scope, args.urls, args.wildcards, args.oos, args.save_in, args.save_out)
 
 if __name__ == "__main__":
-    scope_file = input("Enter the scope file name: ").strip()
-    url_file = input("Enter the URL file name: ").strip()
-    process_urls(scope_file, url_file)
\ No newline at end of file
+    main()
@@ -3,88 +3,129 @@
 
 # Description - this script removes duplicate urls and params from a list of urls
 
-import urllib.parse
-from collections import OrderedDict
 import argparse
+import os
 import sys
+from contextlib import nullcontext
+from multiprocessing import Pool
 
 def normalize_url(url):
     """
-    Normalize the URL by:
-    - Parsing the URL into components.
-    - Sorting the query parameters.
+    Normalize the URL (raw bytes, as read from the input file) by:
+    - Splitting the URL into scheme, netloc, path and query, dropping any fragment.
+      Protocol-relative (//host) and scheme-less URLs are split the way urlsplit splits them.
+    - Collecting the unique query parameter names, sorted alphabetically.
     - Assigning 'FUZZ' as the value for each parameter.
-    - Reconstructing the normalized URL without the path for deduplication.
+    - Building the deduplication key from scheme, netloc and parameters, without the path.
+
+    Working on bytes avoids decoding every line; both returned values are bytes.
     """
     try:
-        parsed = urllib.parse.urlparse(url)
-        query_params = urllib.parse.parse_qs(parsed.query, keep_blank_values=True)
-
-        # Sort the parameters alphabetically by key
-        sorted_params = sorted(query_params.items())
-
-        # Assign 'FUZZ' to each parameter
-        normalized_params = [(param, ['FUZZ']) for param, values in sorted_params]
-
-        # Reconstruct the query string
-        normalized_query = urllib.parse.urlencode(normalized_params, doseq=True)
+        scheme, sep, rest = url.partition(b'://')
+        if sep and scheme and b'/' not in scheme and b'?' not in scheme:
+            # Schemes are case-insensitive; urlparse lowercased them too
+            prefix = scheme.lower() + b'://'
+        elif url.startswith(b'//'):
+            # Protocol-relative URL: the netloc follows the leading '//'
+            prefix = b'//'
+            rest = url[2:]
+        else:
+            # No scheme or netloc (a '://' may only appear inside a query value):
+            # everything before the query is the path, as with urlsplit
+            prefix = None
+            rest = url
+
+        rest = rest.partition(b'#')[0]
+        rest, _, query = rest.partition(b'?')
+        if prefix is None:
+            prefix = netloc = b''
+            path = rest
+        else:
+            slash = rest.find(b'/')
+            netloc, path = (rest, b'') if slash < 0 else (rest[:slash], rest[slash:])
+            if not netloc:
+                return None, None
+
+        # Fast path: with no query string there are no parameters to normalize
+        if not query:
+            dedup_key = prefix + netloc.lower()
+            if not dedup_key:
+                return None, None
+            return dedup_key, prefix + netloc + path
+
+        # Sorted, unique parameter names; values are replaced with 'FUZZ'
+        names = sorted({kv.split(b'=', 1)[0] for kv in query.split(b'&') if kv})
+        normalized_query = b'&'.join(name + b'=FUZZ' for name in names)
+        query_suffix = b'?' + normalized_query if normalized_query else b''
 
         # Deduplication key: scheme + netloc + sorted normalized query
-        dedup_key = urllib.parse.urlunparse((
-            parsed.scheme.lower(),
-            parsed.netloc.lower(),
-            '',  # Ignore the path
-            '',  # Ignore params
-            normalized_query,
-            ''   # Ignore fragment
-        ))
-
-        # For output, reconstruct the URL with the original path and normalized query
-        normalized_url = urllib.parse.urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            '',  # Ignore params
-            normalized_query,
-            ''   # Ignore fragment
-        ))
+        dedup_key = prefix + netloc.lower() + query_suffix
+        if not dedup_key:
+            return None, None
+
+        # For output, keep the original path with the normalized query
+        normalized_url = prefix + netloc + path + query_suffix
 
         return dedup_key, normalized_url
 
     except Exception as e:
-        print(f"Error processing URL: {url}\nException: {e}", file=sys.stderr)
+        print(f"Error processing URL: {url.decode(errors='replace')}\nException: {e}", file=sys.stderr)
         return None, None
 
-def deduplicate_urls(input_file, output_file):
+def iter_urls(input_file):
+    """
+    Yield each non-empty, stripped line from the input file as bytes.
+    """
+    with open(input_file, 'rb') as infile:
+        for line in infile:
+            url = line.strip()
+            if url:
+                yield url
+
+def deduplicate_urls(input_file, output_file, workers=None):
     """
     Read URLs from the input file, normalize them, deduplicate based on domain and params, and write to the output file.
+    Lines are handled as bytes and written out undecoded.
+    With more than one worker, normalization runs across a process pool; the dedup set stays in the main process.
+    Each unique URL is written as soon as its key is first seen; only the keys are kept in memory.
     """
-    unique_keys = {}
+    seen_keys = set()
     total_urls = 0
     duplicate_urls = 0
+    invalid_urls = 0
 
-    with open(input_file, 'r') as infile:
-        for line in infile:
-            url = line.strip()
-            if not url:
-                continue  # Skip empty lines
+    # A pool only pays off with more than one worker; otherwise pickling lines costs more than it saves
+    workers = workers or os.cpu_count() or 1
 
+    with (Pool(workers) if workers > 1 else nullcontext()) as pool, open(output_file, 'wb') as outfile:
+        urls = iter_urls(input_file)
+        # imap (not imap_unordered) keeps first-seen order identical to a serial run
+        results = pool.imap(normalize_url, urls, chunksize=10_000) if pool else map(normalize_url, urls)
+        for dedup_key, normalized_url in results:
             total_urls += 1
-            dedup_key, normalized_url = normalize_url(url)
             if dedup_key and normalized_url:
-                if dedup_key not in unique_keys:
-                    unique_keys[dedup_key] = normalized_url
+                if dedup_key not in seen_keys:
+                    seen_keys.add(dedup_key)
+                    outfile.write(normalized_url + b'\n')
                 else:
                     duplicate_urls += 1
-
-    with open(output_file, 'w') as outfile:
-        for url in unique_keys.values():
-            outfile.write(url + '\n')
+            else:
+                invalid_urls += 1
 
     print(f"Deduplication complete.")
     print(f"Total URLs processed: {total_urls}")
-    print(f"Unique URLs saved: {len(unique_keys)}")
+    print(f"Unique URLs saved: {len(seen_keys)}")
     print(f"Duplicate URLs skipped: {duplicate_urls}")
+    print(f"Invalid URLs skipped: {invalid_urls}")
+
+def positive_int(value):
+    """
+    argparse type for options that must be an integer of at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(
@@ -102,10 +143,11 @@ Usage:
     )
     parser.add_argument('-i', '--input', required=True, help="Path to the input file containing URLs.")
     parser.add_argument('-o', '--output', required=True, help="Path to the output file to save unique URLs.")
+    parser.add_argument('-w', '--workers', type=positive_int, default=None, help="Number of worker processes (default: CPU count; 1 disables the pool).")
 
     args = parser.parse_args()
 
-    deduplicate_urls(args.input, args.output)
+    deduplicate_urls(args.input, args.output, args.workers)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file